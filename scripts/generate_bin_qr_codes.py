@@ -11,168 +11,480 @@ This script generates QR codes for waste bins containing JSON payload with:
 
 Usage:
     python generate_bin_qr_codes.py
-    python generate_bin_qr_codes.py --output-dir ./qr_codes --format png
+    python generate_bin_qr_codes.py --output-dir ./qr_codes --format PNG
 """
 
-import json
-import qrcode
+import io
+import math
+import orjson
+import segno
 import argparse
 import os
-from typing import List, Dict, Any
-import geohash2 as geohash
-from datetime import datetime
+import re
+import tarfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timezone
+import numpy as np
+
+try:
+    from pygeohash_fast import encode_many
+except ImportError:
+    encode_many = None
+
+numba = None
+if encode_many is None:
+    # Only the fallback encoder uses numba, so skip its import cost otherwise
+    try:
+        import numba
+    except ImportError:
+        pass
+
+
+# Fixed mask pattern; every mask decodes, so skip segno's 8-way penalty search
+_QR_MASK_PATTERN = 0
+
+# Render settings shared by every bin: 10px modules, 4-module quiet zone
+_QR_SAVE_OPTIONS = {'scale': 10, 'border': 4, 'dark': 'black', 'light': 'white'}
+
+_GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def _geohash_indices(lat, lng, precision, out):
+    """Fill out with the base32 digit indices of the geohash for (lat, lng)."""
+    lat_lo, lat_hi = -90.0, 90.0
+    lng_lo, lng_hi = -180.0, 180.0
+    even = True
+    for i in range(precision):
+        ch = 0
+        for _ in range(5):
+            ch <<= 1
+            if even:
+                mid = (lng_lo + lng_hi) / 2
+                if lng > mid:
+                    ch |= 1
+                    lng_lo = mid
+                else:
+                    lng_hi = mid
+            else:
+                mid = (lat_lo + lat_hi) / 2
+                if lat > mid:
+                    ch |= 1
+                    lat_lo = mid
+                else:
+                    lat_hi = mid
+            even = not even
+        out[i] = ch
+
+
+if numba is not None:
+    _geohash_indices = numba.njit(cache=True)(_geohash_indices)
+
+
+def _encode_geohash(lat: float, lng: float, precision: int = 8) -> str:
+    """Encode a geohash without pygeohash-fast, JIT-compiled when numba is available."""
+    out = np.zeros(precision, dtype=np.uint8) if numba is not None else bytearray(precision)
+    _geohash_indices(lat, lng, precision, out)
+    return ''.join(_GEOHASH_BASE32[i] for i in out)
+
+
+def _on_geohash_split(lat: float, lng: float, precision: int = 8) -> bool:
+    """Return True if (lat, lng) lies exactly on a cell split or edge at this precision.
+    
+    pygeohash-fast puts such points in the upper half (and wraps the maximum edge
+    to the opposite side), unlike geohash2's strict `> mid` rule.
+    """
+    lng_bits = (precision * 5 + 1) // 2
+    lat_bits = precision * 5 // 2
+    return (((lat + 90.0) / 180.0 * (1 << lat_bits)).is_integer()
+            or ((lng + 180.0) / 360.0 * (1 << lng_bits)).is_integer())
+
+
+def _spread_bits(x: int) -> int:
+    """Spread the low 32 bits of x so they occupy the even bit positions of a 64-bit int."""
+    x &= 0xFFFFFFFF
+    x = (x | (x << 16)) & 0x0000FFFF0000FFFF
+    x = (x | (x << 8)) & 0x00FF00FF00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F0F0F0F0F
+    x = (x | (x << 2)) & 0x3333333333333333
+    x = (x | (x << 1)) & 0x5555555555555555
+    return x
+
+
+def _encode_geohash_int(lat: float, lng: float, bits: int = 40) -> int:
+    """Encode (lat, lng) as an integer geohash holding the top `bits` interleaved bits.
+    
+    A 40-bit value carries the same cell as an 8-character base32 geohash, using
+    the same strict `> mid` split rule as encode_location_geohashes.
+    """
+    # ceil - 1 rather than floor keeps points lying exactly on a split in the lower
+    # half, matching the strict `> mid` test of base32 geohash encoders
+    lat32 = min(max(math.ceil((lat + 90.0) / 180.0 * (1 << 32)) - 1, 0), 0xFFFFFFFF)
+    lng32 = min(max(math.ceil((lng + 180.0) / 360.0 * (1 << 32)) - 1, 0), 0xFFFFFFFF)
+    # Geohash starts with a longitude bit, so longitude takes the odd positions
+    interleaved = (_spread_bits(lng32) << 1) | _spread_bits(lat32)
+    return interleaved >> (64 - bits)
+
+
+def _geohash_base32_to_int(geohash: str) -> int:
+    """Decode a base32 geohash string into its integer form."""
+    value = 0
+    for ch in geohash:
+        value = (value << 5) | _GEOHASH_BASE32.index(ch)
+    return value
+
+
+def _serialize_payload(p: Dict[str, Any]) -> str:
+    """Serialize a bin payload to compact JSON with a fixed key order.
+    
+    Equivalent to json.dumps(p, separators=(',', ':')) for our payload schema. String
+    fields are emitted without escaping, which is safe because bin IDs, categories,
+    geohashes and ISO timestamps are plain ASCII (categories are checked on init).
+    """
+    return (
+        f'{{"bin_id":"{p["bin_id"]}","category":"{p["category"]}",'
+        f'"latitude":{p["latitude"]!r},"longitude":{p["longitude"]!r},'
+        f'"geohash":"{p["geohash"]}","generated_at":"{p["generated_at"]}",'
+        f'"version":"{p["version"]}"}}'
+    )
+
+
+def _write_file(filepath: str, data: bytes) -> None:
+    """Write data to filepath through a raw file descriptor."""
+    data = memoryview(data)
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def render_qr_code(json_data: str, format: str, version: Optional[int] = None) -> bytes:
+    """Render QR code for a serialized payload and return the encoded image bytes.
+    
+    Pass version to skip the symbol size search when it is already known.
+    """
+    # Create QR code with high error correction for outdoor use
+    qr = segno.make(json_data, error='h', version=version, mask=_QR_MASK_PATTERN, micro=False)
+    
+    # Render into memory; segno writes PNG and SVG natively
+    buffer = io.BytesIO()
+    if format.upper() == 'JPEG':
+        # segno has no JPEG writer, so rasterize to PNG and re-encode with Pillow
+        from PIL import Image
+        png_buffer = io.BytesIO()
+        qr.save(png_buffer, kind='png', **_QR_SAVE_OPTIONS)
+        png_buffer.seek(0)
+        Image.open(png_buffer).convert('L').save(buffer, format='JPEG')
+    else:
+        qr.save(buffer, kind=format.lower(), **_QR_SAVE_OPTIONS)
+    
+    return buffer.getvalue()
+
+
+def probe_qr_version(json_payloads: List[str]) -> int:
+    """Return the smallest QR version that fits every serialized payload at high error correction."""
+    longest = max(json_payloads, key=len)
+    return segno.make(longest, error='h', mask=_QR_MASK_PATTERN, micro=False).version
+
+
+def _render_qr_code_worker(task: Tuple[str, str, Optional[int]]) -> bytes:
+    """Process pool entry point; unpacks a task tuple for render_qr_code."""
+    return render_qr_code(*task)
 
 
 class BinQRGenerator:
     """Generator for waste bin QR codes with embedded location and category data."""
     
+    # Payload format version understood by the app's QR scanner
+    PAYLOAD_VERSION = '1.0'
+    
     # Waste categories supported by VibeSweep
     CATEGORIES = ['recycle', 'organic', 'landfill', 'ewaste', 'hazardous']
     
-    # Sample bin locations (replace with real coordinates)
-    SAMPLE_LOCATIONS = [
+    # Sample bin locations (replace with real coordinates), stored as parallel arrays
+    LOC_NAMES = [
         # Downtown area
-        {'lat': 37.7749, 'lng': -122.4194, 'name': 'Downtown SF - Market St'},
-        {'lat': 37.7849, 'lng': -122.4094, 'name': 'Downtown SF - Union Square'},
-        {'lat': 37.7649, 'lng': -122.4294, 'name': 'Downtown SF - SOMA'},
+        'Downtown SF - Market St',
+        'Downtown SF - Union Square',
+        'Downtown SF - SOMA',
         
         # University area
-        {'lat': 37.8719, 'lng': -122.2585, 'name': 'UC Berkeley Campus'},
-        {'lat': 37.8619, 'lng': -122.2485, 'name': 'Berkeley Downtown'},
+        'UC Berkeley Campus',
+        'Berkeley Downtown',
         
         # Park areas
-        {'lat': 37.7694, 'lng': -122.4862, 'name': 'Golden Gate Park'},
-        {'lat': 37.8024, 'lng': -122.4058, 'name': 'Presidio Park'},
+        'Golden Gate Park',
+        'Presidio Park',
         
         # Residential areas
-        {'lat': 37.7849, 'lng': -122.4094, 'name': 'Mission District'},
-        {'lat': 37.7949, 'lng': -122.3994, 'name': 'Castro District'},
-        {'lat': 37.8049, 'lng': -122.4194, 'name': 'Pacific Heights'},
+        'Mission District',
+        'Castro District',
+        'Pacific Heights',
     ]
+    LOC_LATS = np.array([
+        37.7749, 37.7849, 37.7649,  # Downtown area
+        37.8719, 37.8619,           # University area
+        37.7694, 37.8024,           # Park areas
+        37.7849, 37.7949, 37.8049,  # Residential areas
+    ])
+    LOC_LNGS = np.array([
+        -122.4194, -122.4094, -122.4294,  # Downtown area
+        -122.2585, -122.2485,             # University area
+        -122.4862, -122.4058,             # Park areas
+        -122.4094, -122.3994, -122.4194,  # Residential areas
+    ])
+    
+    # Maps location names to filename-safe form in a single pass
+    _NAME_TRANS = str.maketrans({' ': '_', '-': '_'})
     
-    def __init__(self, output_dir: str = './qr_codes'):
-        """Initialize the QR generator with output directory."""
+    # Number of per-bin progress lines printed together
+    PROGRESS_BATCH_SIZE = 16
+    
+    def __init__(self, output_dir: str = './qr_codes', quiet: bool = False, archive: bool = False):
+        """Initialize the QR generator with output directory.
+        
+        With archive=True all images and manifest files go into a single bins.tar, which
+        is finished by close() or by leaving a `with BinQRGenerator(...)` block.
+        """
         self.output_dir = output_dir
+        self.quiet = quiet
+        self.validate_categories()
+        self.upper_categories = {category: category.upper() for category in self.CATEGORIES}
+        if numba is not None:
+            # Pay the JIT compilation cost once here rather than on the first real bin
+            _encode_geohash(0.0, 0.0)
+        # Single timestamp shared by every payload and the manifest of this run
+        self.generated_at = datetime.utcnow().isoformat()
+        self._mk_payload = self.build_payload_factory()
         self.ensure_output_dir()
+        self.archive_path = os.path.join(self.output_dir, 'bins.tar') if archive else None
+        self.archive = None
+        # Every archive member carries the run's timestamp
+        self.archive_mtime = int(datetime.fromisoformat(self.generated_at).replace(tzinfo=timezone.utc).timestamp())
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def validate_categories(self):
+        """Ensure categories are safe to embed in payload JSON without escaping."""
+        for category in self.CATEGORIES:
+            if not re.fullmatch(r'[a-z0-9_]+', category):
+                raise ValueError(f"Unsupported category name: {category!r}")
     
     def ensure_output_dir(self):
         """Create output directory if it doesn't exist."""
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        existed = os.path.isdir(self.output_dir)
+        os.makedirs(self.output_dir, exist_ok=True)
+        if not existed:
             print(f"Created output directory: {self.output_dir}")
     
+    def write_output(self, name: str, data: bytes) -> str:
+        """Write one output file, either into output_dir or as a member of bins.tar."""
+        if self.archive_path is not None:
+            if self.archive is None:
+                self.archive = tarfile.open(self.archive_path, 'w')
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = self.archive_mtime
+            self.archive.addfile(info, io.BytesIO(data))
+            return name
+        
+        filepath = os.path.join(self.output_dir, name)
+        _write_file(filepath, data)
+        return filepath
+    
+    def close(self):
+        """Finish the output archive, if one is open."""
+        if self.archive is not None:
+            self.archive.close()
+            self.archive = None
+    
+    def flush_progress(self, lines: List[str]):
+        """Print buffered progress lines in one write and clear the buffer."""
+        if lines and not self.quiet:
+            print('\n'.join(lines))
+        lines.clear()
+    
     def generate_bin_id(self, location_idx: int, category: str) -> str:
         """Generate unique bin ID based on location and category."""
-        return f"BIN_{location_idx:03d}_{category.upper()}"
+        return f"BIN_{location_idx:03d}_{self.upper_categories[category]}"
+    
+    def encode_location_geohashes(self, precision: int = 8) -> List[str]:
+        """Encode geohashes for all sample locations in a single batch call."""
+        lats = self.LOC_LATS.tolist()
+        lngs = self.LOC_LNGS.tolist()
+        if encode_many is None:
+            return [_encode_geohash(lat, lng, precision) for lat, lng in zip(lats, lngs)]
+        
+        geohashes = list(encode_many(self.LOC_LNGS, self.LOC_LATS, precision))
+        # Re-encode points on a split so both paths follow geohash2's cell assignment
+        for i, (lat, lng) in enumerate(zip(lats, lngs)):
+            if _on_geohash_split(lat, lng, precision):
+                geohashes[i] = _encode_geohash(lat, lng, precision)
+        return geohashes
+    
+    def encode_location_geohash_ints(self, geohashes: List[str]) -> List[int]:
+        """Encode integer geohashes for all sample locations, checked against their base32 form."""
+        lats = self.LOC_LATS.tolist()
+        lngs = self.LOC_LNGS.tolist()
+        geohash_ints = []
+        for lat, lng, geohash in zip(lats, lngs, geohashes):
+            geohash_int = _encode_geohash_int(lat, lng, bits=5 * len(geohash))
+            if geohash_int != _geohash_base32_to_int(geohash):
+                raise ValueError(f"Integer geohash disagrees with {geohash!r} at ({lat}, {lng})")
+            geohash_ints.append(geohash_int)
+        return geohash_ints
+    
+    def build_payload_factory(self):
+        """Compile a payload builder with this run's constant fields baked in."""
+        src = (
+            "def _mk(bin_id, category, lat, lng, gh):\n"
+            "    return {'bin_id': bin_id, 'category': category, 'latitude': lat, "
+            "'longitude': lng, 'geohash': gh, 'generated_at': %r, 'version': %r}\n"
+            % (self.generated_at, self.PAYLOAD_VERSION)
+        )
+        namespace = {}
+        exec(src, namespace)
+        return namespace['_mk']
     
-    def create_bin_payload(self, bin_id: str, category: str, lat: float, lng: float) -> Dict[str, Any]:
+    def create_bin_payload(self, bin_id: str, category: str, lat: float, lng: float,
+                           geohash: str) -> Dict[str, Any]:
         """Create JSON payload for QR code."""
-        return {
-            'bin_id': bin_id,
-            'category': category,
-            'latitude': lat,
-            'longitude': lng,
-            'geohash': geohash.encode(lat, lng, precision=8),
-            'generated_at': datetime.utcnow().isoformat(),
-            'version': '1.0'
-        }
+        return self._mk_payload(bin_id, category, lat, lng, geohash)
     
-    def generate_qr_code(self, payload: Dict[str, Any], filename: str, format: str = 'PNG') -> str:
+    def generate_qr_code(self, payload: Dict[str, Any], filename: str, format: str = 'SVG') -> str:
         """Generate QR code from payload and save to file."""
-        # Convert payload to JSON string
-        json_data = json.dumps(payload, separators=(',', ':'))
-        
-        # Create QR code with high error correction for outdoor use
-        qr = qrcode.QRCode(
-            version=1,  # Auto-adjust size
-            error_correction=qrcode.constants.ERROR_CORRECT_H,  # High error correction
-            box_size=10,  # Size of each box in pixels
-            border=4,  # Border size in boxes
-        )
-        
-        qr.add_data(json_data)
-        qr.make(fit=True)
-        
-        # Create QR code image
-        img = qr.make_image(fill_color="black", back_color="white")
-        
-        # Save image
-        filepath = os.path.join(self.output_dir, f"{filename}.{format.lower()}")
-        img.save(filepath)
-        
-        return filepath
+        data = render_qr_code(_serialize_payload(payload), format)
+        return self.write_output(f"{filename}.{format.lower()}", data)
     
-    def generate_all_bins(self, format: str = 'PNG') -> List[Dict[str, Any]]:
+    def generate_all_bins(self, format: str = 'SVG') -> List[Dict[str, Any]]:
         """Generate QR codes for all bin combinations."""
         generated_bins = []
+        json_payloads = []
         
-        print(f"Generating QR codes for {len(self.SAMPLE_LOCATIONS)} locations × {len(self.CATEGORIES)} categories...")
+        print(f"Generating QR codes for {len(self.LOC_NAMES)} locations × {len(self.CATEGORIES)} categories...")
         
-        for loc_idx, location in enumerate(self.SAMPLE_LOCATIONS):
+        # Geohash depends only on the location, so encode every location once up front
+        geohashes = self.encode_location_geohashes()
+        # tolist() hands back native floats so payloads serialize exactly as before
+        lats = self.LOC_LATS.tolist()
+        lngs = self.LOC_LNGS.tolist()
+        geohash_ints = self.encode_location_geohash_ints(geohashes)
+        
+        for loc_idx in range(len(self.LOC_NAMES)):
+            lat, lng, name = lats[loc_idx], lngs[loc_idx], self.LOC_NAMES[loc_idx]
+            safe_name = name.translate(self._NAME_TRANS)
             for category in self.CATEGORIES:
                 # Generate bin data
                 bin_id = self.generate_bin_id(loc_idx, category)
                 payload = self.create_bin_payload(
                     bin_id=bin_id,
                     category=category,
-                    lat=location['lat'],
-                    lng=location['lng']
+                    lat=lat,
+                    lng=lng,
+                    geohash=geohashes[loc_idx]
                 )
                 
                 # Generate filename
-                safe_name = location['name'].replace(' ', '_').replace('-', '_')
                 filename = f"{safe_name}_{category}_{bin_id}"
                 
-                # Generate QR code
-                filepath = self.generate_qr_code(payload, filename, format)
-                
-                # Store bin info
-                bin_info = {
+                # Store bin info; qr_file is filled in once the image is rendered
+                generated_bins.append({
                     **payload,
-                    'location_name': location['name'],
-                    'qr_file': filepath,
+                    'geohash_int': geohash_ints[loc_idx],
+                    'location_name': name,
+                    'qr_file': None,
                     'filename': filename
-                }
-                generated_bins.append(bin_info)
-                
-                print(f"Generated: {filename}")
+                })
+                # Serialize once; the same string sizes the symbol and is encoded by the worker
+                json_payloads.append(_serialize_payload(payload))
+        
+        # Payloads share one schema, so size the symbol once and render every bin at that version
+        qr_version = probe_qr_version(json_payloads)
+        tasks = [(json_data, format, qr_version) for json_data in json_payloads]
+        
+        # QR rendering is CPU-bound and independent per bin, so spread it across processes;
+        # writes stay in this process so they can share one archive stream
+        progress = []
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            images = executor.map(_render_qr_code_worker, tasks, chunksize=4)
+            for bin_info, data in zip(generated_bins, images):
+                bin_info['qr_file'] = self.write_output(f"{bin_info['filename']}.{format.lower()}", data)
+                progress.append(f"Generated: {bin_info['filename']}")
+                if len(progress) >= self.PROGRESS_BATCH_SIZE:
+                    self.flush_progress(progress)
+        self.flush_progress(progress)
         
         return generated_bins
     
     def save_bin_manifest(self, bins: List[Dict[str, Any]]) -> str:
-        """Save manifest file with all bin information."""
-        manifest_path = os.path.join(self.output_dir, 'bin_manifest.json')
+        """Save manifest summary plus an NDJSON bin list with a bin_id -> byte offset index."""
+        bins_name = 'bin_manifest.ndjson'
+        index_name = 'bin_manifest.idx'
+        
+        # One bin per line so a consumer can seek straight to a bin without parsing the rest
+        index = {}
+        lines = []
+        offset = 0
+        for bin_info in bins:
+            line = orjson.dumps(bin_info, option=orjson.OPT_APPEND_NEWLINE)
+            index[bin_info['bin_id']] = offset
+            offset += len(line)
+            lines.append(line)
+        
+        self.write_output(bins_name, b''.join(lines))
+        self.write_output(index_name, orjson.dumps(index))
         
         manifest = {
-            'generated_at': datetime.utcnow().isoformat(),
+            'generated_at': self.generated_at,
             'total_bins': len(bins),
             'categories': self.CATEGORIES,
-            'locations_count': len(self.SAMPLE_LOCATIONS),
-            'bins': bins
+            'locations_count': len(self.LOC_NAMES),
+            # [min_lat, min_lng, max_lat, max_lng] and [lat, lng] for map-based tooling
+            'bbox': [float(self.LOC_LATS.min()), float(self.LOC_LNGS.min()),
+                     float(self.LOC_LATS.max()), float(self.LOC_LNGS.max())],
+            'centroid': [float(self.LOC_LATS.mean()), float(self.LOC_LNGS.mean())],
+            'bins_file': bins_name,
+            'index_file': index_name
         }
         
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        manifest_path = self.write_output('bin_manifest.json', orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        if self.archive_path is not None:
+            # Point at the member inside the archive, not a file that isn't on disk
+            manifest_path = f"{self.archive_path}:{manifest_path}"
         
         print(f"Saved manifest: {manifest_path}")
         return manifest_path
     
-    def generate_test_bins(self, count: int = 5, format: str = 'PNG') -> List[Dict[str, Any]]:
+    def generate_test_bins(self, count: int = 5, format: str = 'SVG') -> List[Dict[str, Any]]:
         """Generate a small set of test bins for development."""
         test_bins = []
+        progress = []
         
         print(f"Generating {count} test bins...")
         
+        geohashes = self.encode_location_geohashes()
+        geohash_ints = self.encode_location_geohash_ints(geohashes)
+        lats = self.LOC_LATS.tolist()
+        lngs = self.LOC_LNGS.tolist()
+        
         for i in range(count):
-            location = self.SAMPLE_LOCATIONS[i % len(self.SAMPLE_LOCATIONS)]
+            loc_idx = i % len(self.LOC_NAMES)
+            lat, lng, name = lats[loc_idx], lngs[loc_idx], self.LOC_NAMES[loc_idx]
             category = self.CATEGORIES[i % len(self.CATEGORIES)]
             
-            bin_id = f"TEST_{i:03d}_{category.upper()}"
+            bin_id = f"TEST_{i:03d}_{self.upper_categories[category]}"
             payload = self.create_bin_payload(
                 bin_id=bin_id,
                 category=category,
-                lat=location['lat'],
-                lng=location['lng']
+                lat=lat,
+                lng=lng,
+                geohash=geohashes[loc_idx]
             )
             
             filename = f"test_{i:03d}_{category}_{bin_id}"
@@ -180,13 +492,17 @@ class BinQRGenerator:
             
             bin_info = {
                 **payload,
-                'location_name': location['name'],
+                'geohash_int': geohash_ints[loc_idx],
+                'location_name': name,
                 'qr_file': filepath,
                 'filename': filename
             }
             test_bins.append(bin_info)
             
-            print(f"Generated test bin: {filename}")
+            progress.append(f"Generated test bin: {filename}")
+            if len(progress) >= self.PROGRESS_BATCH_SIZE:
+                self.flush_progress(progress)
+        self.flush_progress(progress)
         
         return test_bins
 
@@ -195,28 +511,33 @@ def main():
     """Main function to run QR code generation."""
     parser = argparse.ArgumentParser(description='Generate QR codes for VibeSweep waste bins')
     parser.add_argument('--output-dir', default='./qr_codes', help='Output directory for QR codes')
-    parser.add_argument('--format', default='PNG', choices=['PNG', 'JPEG', 'SVG'], help='Output format')
+    parser.add_argument('--format', default='SVG', choices=['PNG', 'JPEG', 'SVG'], help='Output format')
     parser.add_argument('--test-only', action='store_true', help='Generate only test bins (5 bins)')
     parser.add_argument('--count', type=int, default=5, help='Number of test bins to generate')
+    parser.add_argument('--quiet', action='store_true', help='Suppress per-bin progress output')
+    parser.add_argument('--archive', action='store_true', help='Write all QR codes and manifest files into a single bins.tar')
     
     args = parser.parse_args()
     
     # Initialize generator
-    generator = BinQRGenerator(output_dir=args.output_dir)
+    generator = BinQRGenerator(output_dir=args.output_dir, quiet=args.quiet, archive=args.archive)
     
     try:
-        if args.test_only:
-            # Generate test bins only
-            bins = generator.generate_test_bins(count=args.count, format=args.format)
-        else:
-            # Generate all bins
-            bins = generator.generate_all_bins(format=args.format)
-        
-        # Save manifest
-        manifest_path = generator.save_bin_manifest(bins)
+        with generator:
+            if args.test_only:
+                # Generate test bins only
+                bins = generator.generate_test_bins(count=args.count, format=args.format)
+            else:
+                # Generate all bins
+                bins = generator.generate_all_bins(format=args.format)
+            
+            # Save manifest
+            manifest_path = generator.save_bin_manifest(bins)
         
         print(f"\n✅ Successfully generated {len(bins)} QR codes")
         print(f"📁 Output directory: {args.output_dir}")
+        if generator.archive_path:
+            print(f"📦 Archive: {generator.archive_path}")
         print(f"📄 Manifest file: {manifest_path}")
         print(f"\nTo use in Flutter app:")
         print(f"1. Copy QR code images to test devices or print them")
@@ -229,6 +550,5 @@ def main():
     
     return 0
 
-
 if __name__ == '__main__':
     exit(main())
\ No newline at end of file